@@ -63,13 +63,11 @@ def __check_length(
 
 def __check_channels(
     array: np.ndarray, info_code_mono: Code, error_code_not_stereo: Code
-) -> np.ndarray:
+) -> None:
     if is_mono(array):
         info(info_code_mono)
-        array = mono_to_stereo(array)
     elif not is_stereo(array):
         raise ModuleError(error_code_not_stereo)
-    return array
 
 
 def __check_clipping_limiting(
@@ -106,7 +104,7 @@ def check(
         else Code.ERROR_REFERENCE_LENGTH_LENGTH_TOO_SMALL,
     )
 
-    array = __check_channels(
+    __check_channels(
         array,
         Code.INFO_TARGET_IS_MONO if name == "TARGET" else Code.INFO_REFERENCE_IS_MONO,
         Code.ERROR_TARGET_NUM_OF_CHANNELS_IS_EXCEEDED
@@ -125,6 +123,10 @@ def check(
         else Code.INFO_REFERENCE_IS_RESAMPLED,
     )
 
+    # Duplicate mono after resampling, so that only one channel is resampled
+    if is_mono(array):
+        array = mono_to_stereo(array)
+
     if name == "TARGET":
         __check_clipping_limiting(
             array,
@@ -137,6 +139,16 @@ def check(
     return array, sample_rate
 
 
+def __is_close(array_a: np.ndarray, array_b: np.ndarray) -> bool:
+    # Compare block by block to stop at the first different block
+    block_size = 2**16
+    for begin in range(0, size(array_a), block_size):
+        end = begin + block_size
+        if not np.allclose(array_a[begin:end], array_b[begin:end]):
+            return False
+    return True
+
+
 def check_equality(target: np.ndarray, reference: np.ndarray) -> None:
-    if target.shape == reference.shape and np.allclose(target, reference):
+    if target.shape == reference.shape and __is_close(target, reference):
         raise ModuleError(Code.ERROR_TARGET_EQUALS_REFERENCE)
@@ -19,7 +19,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import numpy as np
-import statsmodels.api as sm
+from functools import lru_cache
+from statsmodels.nonparametric.smoothers_lowess import lowess
 
 
 def size(array: np.ndarray) -> int:
@@ -47,25 +48,24 @@ def mono_to_stereo(array: np.ndarray) -> np.ndarray:
 
 
 def count_max_peaks(array: np.ndarray) -> (float, int):
-    max_value = np.abs(array).max()
-    max_count = np.count_nonzero(
-        np.logical_or(np.isclose(array, max_value), np.isclose(array, -max_value))
-    )
+    abs_array = np.abs(array)
+    max_value = abs_array.max()
+    max_count = np.count_nonzero(np.isclose(abs_array, max_value))
     return max_value, max_count
 
 
 def lr_to_ms(array: np.ndarray) -> (np.ndarray, np.ndarray):
-    array = np.copy(array)
-    array[:, 0] += array[:, 1]
-    array[:, 0] *= 0.5
-    mid = np.copy(array[:, 0])
-    array[:, 0] -= array[:, 1]
-    side = np.copy(array[:, 0])
+    mid = np.add(array[:, 0], array[:, 1])
+    mid *= 0.5
+    side = np.subtract(mid, array[:, 1])
     return mid, side
 
 
 def ms_to_lr(mid_array: np.ndarray, side_array: np.ndarray) -> np.ndarray:
-    return np.vstack((mid_array + side_array, mid_array - side_array)).T
+    array = np.empty((size(mid_array), 2), dtype=np.result_type(mid_array, side_array))
+    np.add(mid_array, side_array, out=array[:, 0])
+    np.subtract(mid_array, side_array, out=array[:, 1])
+    return array
 
 
 def unfold(array: np.ndarray, piece_size: int, divisions: int) -> np.ndarray:
@@ -86,28 +86,30 @@ def batch_rms(array: np.ndarray) -> np.ndarray:
     return np.sqrt(np.squeeze(multiplicand @ multiplier, axis=(1, 2)) / piece_size)
 
 
-def amplify(array: np.ndarray, gain: float) -> np.ndarray:
-    return array * gain
+def amplify(array: np.ndarray, gain: float, out: np.ndarray = None) -> np.ndarray:
+    return np.multiply(array, gain, out=out)
 
 
 def normalize(
     array: np.ndarray, threshold: float, epsilon: float, normalize_clipped: bool
 ) -> (np.ndarray, float):
     coefficient = 1.0
-    max_value = np.abs(array).max()
+    # Same as np.abs(array).max(), but without the temporary array
+    max_value = max(array.max(), -array.min())
     if max_value < threshold or normalize_clipped:
         coefficient = max(epsilon, max_value / threshold)
+    if coefficient == 1.0:
+        return array, coefficient
     return array / coefficient, coefficient
 
 
 def smooth_lowess(array: np.ndarray, frac: float, it: int, delta: float) -> np.ndarray:
-    return sm.nonparametric.lowess(
-        array, np.linspace(0, 1, len(array)), frac=frac, it=it, delta=delta
-    )[:, 1]
+    grid = np.linspace(0, 1, len(array))
+    return lowess(array, grid, frac=frac, it=it, delta=delta)[:, 1]
 
 
-def clip(array: np.ndarray, to: float = 1) -> np.ndarray:
-    return np.clip(array, -to, to)
+def clip(array: np.ndarray, to: float = 1, out: np.ndarray = None) -> np.ndarray:
+    return np.clip(array, -to, to, out=out)
 
 
 def flip(array: np.ndarray) -> np.ndarray:
@@ -116,7 +118,7 @@ def flip(array: np.ndarray) -> np.ndarray:
 
 def rectify(array: np.ndarray, threshold: float) -> np.ndarray:
     rectified = np.abs(array).max(1)
-    rectified[rectified <= threshold] = threshold
+    np.maximum(rectified, threshold, out=rectified)
     rectified /= threshold
     return rectified
 
@@ -143,9 +145,16 @@ def batch_rms_2d(array: np.ndarray) -> np.ndarray:
     return batch_rms(array.reshape(array.shape[0], array.shape[1] * array.shape[2]))
 
 
+@lru_cache(maxsize=4)
+def __fade_in_curve(fade_size: int) -> np.ndarray:
+    curve = np.linspace(0, 1, fade_size)
+    curve.setflags(write=False)
+    return curve
+
+
 def fade(array: np.ndarray, fade_size: int) -> np.ndarray:
     array = np.copy(array)
-    fade_in = np.linspace(0, 1, fade_size)
+    fade_in = __fade_in_curve(fade_size)
     fade_out = fade_in[::-1]
     array[:fade_size].T[:] *= fade_in
     array[size(array) - fade_size :].T[:] *= fade_out
@@ -21,11 +21,11 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import numpy as np
 import math
 from scipy import signal
-from scipy.ndimage.filters import maximum_filter1d
+from scipy.ndimage import maximum_filter1d
 
 from .. import Config
 from ..log import debug
-from ..dsp import rectify, flip, max_mix
+from ..dsp import size, rectify, flip, max_mix
 from ..utils import make_odd, ms_to_samples
 
 
@@ -36,8 +36,10 @@ def __sliding_window_fast(
         window_size = make_odd(window_size)
         return maximum_filter1d(array, size=(2 * window_size - 1))
     half_window_size = (window_size - 1) // 2
-    array = np.pad(array, (half_window_size, 0))
-    return maximum_filter1d(array, size=window_size)[:-half_window_size]
+    padded = np.empty(half_window_size + size(array), dtype=array.dtype)
+    padded[:half_window_size] = 0
+    padded[half_window_size:] = array
+    return maximum_filter1d(padded, size=window_size)[:-half_window_size]
 
 
 def __process_attack(array: np.ndarray, config: Config) -> (np.ndarray, np.ndarray):
@@ -80,18 +82,16 @@ def limit(array: np.ndarray, config: Config) -> np.ndarray:
     debug("The limiter is started. Preparing the gain envelope...")
     rectified = rectify(array, config.threshold)
 
-    if np.all(np.isclose(rectified, 1.0)):
+    if np.isclose(rectified.max(), 1.0):
         debug("The limiter is not needed!")
         return array
 
     gain_hard_clip = flip(1.0 / rectified)
     debug("Modifying the gain envelope: attack stage...")
-    gain_attack, gain_hard_clip_slided = __process_attack(
-        np.copy(gain_hard_clip), config
-    )
+    gain_attack, gain_hard_clip_slided = __process_attack(gain_hard_clip, config)
 
     debug("Modifying the gain envelope: hold / release stage...")
-    gain_release = __process_release(np.copy(gain_hard_clip_slided), config)
+    gain_release = __process_release(gain_hard_clip_slided, config)
 
     debug("Finalizing the gain envelope...")
     gain = flip(max_mix(gain_hard_clip, gain_attack, gain_release))
@@ -22,17 +22,29 @@ import os
 import numpy as np
 import soundfile as sf
 import subprocess
+from contextlib import suppress
 
 from .log import Code, warning, info, debug, ModuleError
 from .utils import random_file
 
 
+def __notify_lossy(file_type: str) -> None:
+    if file_type == "TARGET":
+        warning(Code.WARNING_TARGET_IS_LOSSY)
+    else:
+        info(Code.INFO_REFERENCE_IS_LOSSY)
+
+
 def load(file: str, file_type: str, temp_folder: str) -> (np.ndarray, int):
     file_type = file_type.upper()
     sound, sample_rate = None, None
     debug(f"Loading the {file_type} file: '{file}'...")
     try:
-        sound, sample_rate = sf.read(file, always_2d=True)
+        # libsndfile >= 1.1 decodes MP3 itself, so ffmpeg is only a fallback
+        with sf.SoundFile(file) as f:
+            sound, sample_rate = f.read(always_2d=True), f.samplerate
+            if f.format == "MP3":
+                __notify_lossy(file_type)
     except RuntimeError as e:
         debug(e)
         e = str(e)
@@ -59,11 +71,7 @@ def __load_with_ffmpeg(
                 ["ffmpeg", "-i", file, temp_file], stdout=devnull, stderr=devnull
             )
             sound, sample_rate = sf.read(temp_file, always_2d=True)
-            if file_type == "TARGET":
-                warning(Code.WARNING_TARGET_IS_LOSSY)
-            else:
-                info(Code.INFO_REFERENCE_IS_LOSSY)
-            os.remove(temp_file)
+            __notify_lossy(file_type)
         except FileNotFoundError:
             debug(
                 "ffmpeg is not found in the system! "
@@ -71,4 +79,7 @@ def __load_with_ffmpeg(
             )
         except subprocess.CalledProcessError:
             debug(f"ffmpeg cannot convert '{file}' to .wav!")
+        finally:
+            with suppress(FileNotFoundError):
+                os.remove(temp_file)
     return sound, sample_rate
@@ -19,44 +19,59 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import numpy as np
-from time import time
-from scipy import signal, interpolate
+from time import perf_counter
+from functools import lru_cache
+from scipy import signal, interpolate, fft
 
 from ..log import debug
 from .. import Config
 from ..dsp import ms_to_lr, smooth_lowess
 
 
-def __average_fft(
-    loudest_pieces: np.ndarray, sample_rate: int, fft_size: int
-) -> np.ndarray:
-    *_, specs = signal.stft(
-        loudest_pieces,
-        sample_rate,
-        window="boxcar",
-        nperseg=fft_size,
-        noverlap=0,
-        boundary=None,
-        padded=False,
-    )
-    return np.abs(specs).mean((0, 2))
+@lru_cache(maxsize=16)
+def __hann_window(size: int) -> np.ndarray:
+    window = signal.windows.hann(size)
+    window.setflags(write=False)
+    return window
 
 
-def __smooth_exponentially(matching_fft: np.ndarray, config: Config) -> np.ndarray:
-    grid_linear = (
-        config.internal_sample_rate * 0.5 * np.linspace(0, 1, config.fft_size // 2 + 1)
+def __average_fft(loudest_pieces: np.ndarray, fft_size: int) -> np.ndarray:
+    # Same as a boxcar STFT without overlap, boundary extension and padding,
+    # but as one batched multithreaded FFT over the reshaped frames
+    piece_count, piece_size = loudest_pieces.shape
+    frames = loudest_pieces[:, : piece_size // fft_size * fft_size].reshape(
+        piece_count, -1, fft_size
     )
+    specs = fft.rfft(frames, axis=-1, workers=-1)
+    return np.abs(specs).mean((0, 1)) / fft_size
+
+
+@lru_cache(maxsize=16)
+def __frequency_grids(
+    sample_rate: int, fft_size: int, lin_log_oversampling: int
+) -> (np.ndarray, np.ndarray):
+    grid_linear = sample_rate * 0.5 * np.linspace(0, 1, fft_size // 2 + 1)
 
     grid_logarithmic = (
-        config.internal_sample_rate
+        sample_rate
         * 0.5
         * np.logspace(
-            np.log10(4 / config.fft_size),
+            np.log10(4 / fft_size),
             0,
-            (config.fft_size // 2) * config.lin_log_oversampling + 1,
+            (fft_size // 2) * lin_log_oversampling + 1,
         )
     )
 
+    grid_linear.setflags(write=False)
+    grid_logarithmic.setflags(write=False)
+    return grid_linear, grid_logarithmic
+
+
+def __smooth_exponentially(matching_fft: np.ndarray, config: Config) -> np.ndarray:
+    grid_linear, grid_logarithmic = __frequency_grids(
+        config.internal_sample_rate, config.fft_size, config.lin_log_oversampling
+    )
+
     interpolator = interpolate.interp1d(grid_linear, matching_fft, "cubic")
     matching_fft_log = interpolator(grid_logarithmic)
 
@@ -83,12 +98,8 @@ def get_fir(
 ) -> np.ndarray:
     debug(f"Calculating the {name} FIR for the matching EQ...")
 
-    target_average_fft = __average_fft(
-        target_loudest_pieces, config.internal_sample_rate, config.fft_size
-    )
-    reference_average_fft = __average_fft(
-        reference_loudest_pieces, config.internal_sample_rate, config.fft_size
-    )
+    target_average_fft = __average_fft(target_loudest_pieces, config.fft_size)
+    reference_average_fft = __average_fft(reference_loudest_pieces, config.fft_size)
 
     np.maximum(config.min_value, target_average_fft, out=target_average_fft)
     matching_fft = reference_average_fft / target_average_fft
@@ -96,7 +107,7 @@ def get_fir(
     matching_fft_filtered = __smooth_exponentially(matching_fft, config)
 
     fir = np.fft.irfft(matching_fft_filtered)
-    fir = np.fft.ifftshift(fir) * signal.windows.hann(len(fir))
+    fir = np.fft.ifftshift(fir) * __hann_window(len(fir))
 
     return fir
 
@@ -108,10 +119,10 @@ def convolve(
     side_fir: np.ndarray,
 ) -> (np.ndarray, np.ndarray):
     debug("Convolving the TARGET audio with calculated FIRs...")
-    timer = time()
+    timer = perf_counter()
     result_mid = signal.fftconvolve(target_mid, mid_fir, "same")
     result_side = signal.fftconvolve(target_side, side_fir, "same")
-    debug(f"The convolution is done in {time() - timer:.2f} seconds")
+    debug(f"The convolution is done in {perf_counter() - timer:.2f} seconds")
 
     debug("Converting MS to LR...")
     result = ms_to_lr(result_mid, result_side)
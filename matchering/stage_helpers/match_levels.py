@@ -125,8 +125,8 @@ def get_rms_c_and_amplify_pair(
     )
 
     debug(f"Modifying the amplitudes of the {name} audio...")
-    array_main = amplify(array_main, rms_coefficient)
-    array_additional = amplify(array_additional, rms_coefficient)
+    amplify(array_main, rms_coefficient, out=array_main)
+    amplify(array_additional, rms_coefficient, out=array_additional)
 
     return rms_coefficient, array_main, array_additional
 
@@ -87,8 +87,8 @@ def __match_levels(
     )
 
     debug("Modifying the amplitudes of the extracted loudest TARGET pieces...")
-    target_mid_loudest_pieces = amplify(target_mid_loudest_pieces, rms_coefficient)
-    target_side_loudest_pieces = amplify(target_side_loudest_pieces, rms_coefficient)
+    amplify(target_mid_loudest_pieces, rms_coefficient, out=target_mid_loudest_pieces)
+    amplify(target_side_loudest_pieces, rms_coefficient, out=target_side_loudest_pieces)
 
     return (
         target_mid,
@@ -146,9 +146,10 @@ def __correct_levels(
     debug_line()
     info(Code.INFO_CORRECTING_LEVELS)
 
+    result_mid_clipped = np.empty_like(result_mid)
     for step in range(1, config.rms_correction_steps + 1):
         debug(f"Applying RMS correction #{step}...")
-        result_mid_clipped = clip(result_mid)
+        clip(result_mid, out=result_mid_clipped)
 
         _, clipped_rmses, clipped_average_rms = get_average_rms(
             result_mid_clipped, target_piece_size, target_divisions, "result"
@@ -200,7 +201,8 @@ def __finalize(
     result = None
     if need_default:
         result = limit(result_no_limiter, config)
-        result = amplify(result, final_amplitude_coefficient)
+        if final_amplitude_coefficient != 1.0:
+            result = amplify(result, final_amplitude_coefficient)
 
     result_no_limiter = result_no_limiter if need_no_limiter else None
 